@@ -34,6 +34,10 @@ class Id(BaseNode):
     #: Tell which the type this ID belongs to, needs to be overwritten.
     type_name = ...  # need to be defined by subclass!
 
+    #: The primary key value to query, when the ID can be combined in a "pk IN (..)" lookup.
+    #: This is None when the ID needs its own build_query() logic.
+    pk_value = None
+
     def build_query(self, compiler) -> Q:
         raise NotImplementedError()
 
@@ -62,9 +66,10 @@ class ResourceId(Id):
     @classmethod
     @expect_tag(FES20, "ResourceId", leaf=True)
     def from_xml(cls, element):
-        version = element.get("version")
-        startTime = element.get("startTime")
-        endTime = element.get("endTime")
+        attrib = element.attrib
+        version = attrib.get("version")
+        startTime = attrib.get("startTime")
+        endTime = attrib.get("endTime")
 
         if version:
             version = auto_cast(version)
@@ -76,14 +81,22 @@ class ResourceId(Id):
             endTime=parse_iso_datetime(endTime) if endTime else None,
         )
 
+    @property
+    def pk_value(self):
+        """The primary key to query, or None when the ID also filters on version/time."""
+        if self.startTime or self.endTime or self.version:
+            return None
+        return self.id or self.rid
+
     def build_query(self, compiler=None) -> Q:
         """Render the SQL filter"""
-        if self.startTime or self.endTime or self.version:
+        pk_value = self.pk_value
+        if pk_value is None:
             raise NotImplementedError(
                 "No support for <fes:ResourceId> startTime/endTime/version attributes"
             )
 
-        lookup = Q(pk=self.id or self.rid)
+        lookup = Q(("pk", pk_value))
         if compiler is not None:
             # When the
             # NOTE: type_name is currently read by the IdOperator that contains this object,
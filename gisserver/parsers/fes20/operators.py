@@ -2,8 +2,6 @@
 The class names and attributes are identical to those in the FES spec.
 """
 from __future__ import annotations
-from itertools import groupby
-
 import operator
 from dataclasses import dataclass, field
 from decimal import Decimal
@@ -188,12 +186,12 @@ class IdOperator(Operator):
 
     @cached_property
     def grouped_ids(self) -> dict[str, list[Id]]:
-        # For itertools.groupby(), items have to be sorted first.
-        ids = sorted(self.id, key=operator.attrgetter("rid"))
-        return {
-            type_name: list(items)
-            for type_name, items in groupby(ids, key=operator.attrgetter("type_name"))
-        }
+        # Group in a single pass. Sorting on "rid" for itertools.groupby() would not
+        # keep a dotted type name (e.g. "a.b.1" between "a.a" and "a.c") together.
+        grouped = {}
+        for id in self.id:
+            grouped.setdefault(id.type_name, []).append(id)
+        return grouped
 
     def build_query(self, compiler):
         """Generate the ID lookup query.
@@ -208,9 +206,26 @@ class IdOperator(Operator):
             return
 
         for type_name, items in self.grouped_ids.items():
-            ids_subset = reduce(
-                operator.or_, [id.build_query(compiler=None) for id in items]
-            )
+            # Plain identifiers are combined into a single "pk IN (...)" lookup,
+            # which databases handle better than many "pk = .. OR pk = .." clauses.
+            # Other identifiers provide their own lookup.
+            pk_values = []
+            lookups = []
+            for id in items:
+                if id.pk_value is not None:
+                    pk_values.append(id.pk_value)
+                else:
+                    lookups.append(id.build_query(compiler=None))
+
+            if pk_values:
+                # The Q children are passed as (lookup, value) tuples, just like
+                # ResourceId.build_query() does. This avoids Q building a kwargs dict.
+                if len(pk_values) == 1:
+                    lookups.insert(0, Q(("pk", pk_values[0])))
+                else:
+                    lookups.insert(0, Q(("pk__in", pk_values)))
+
+            ids_subset = reduce(operator.or_, lookups)
             compiler.add_lookups(ids_subset, type_name=type_name)
 
 
@@ -35,7 +35,7 @@ from django.core.exceptions import (
     ObjectDoesNotExist,
     ValidationError,
 )
-from django.db.models import Q
+from django.db.models import Lookup, Q
 from django.db.models.fields.related import (
     RelatedField,
     ForeignObjectRel,
@@ -173,15 +173,20 @@ class XsdTypes(XsdAnyType, Enum):
     gmlAbstractFeatureType = "gml:AbstractFeatureType"
     gmlAbstractGMLType = "gml:AbstractGMLType"  # base class of gml:AbstractFeatureType
 
+    def __init__(self, value):
+        # Extrapolate the prefix from the type name once, as members are singletons.
+        # This also avoids repeating these string operations while rendering XML.
+        prefix, colon, _ = value.partition(":")
+        self.prefix = prefix if colon else None
+        self._xs_name = value if colon else f"xs:{value}"
+
     def __str__(self):
         return self.value
 
-    @property
-    def prefix(self) -> str | None:
-        """Extrapolate the prefix from the type name"""
-        xml_name = str(self)
-        colon = xml_name.find(":")
-        return xml_name[:colon] if colon else None
+    def with_prefix(self, prefix="xs"):
+        if prefix == "xs":
+            return self._xs_name
+        return self.value if self.prefix else f"{prefix}:{self.value}"
 
     @cached_property
     def is_geometry(self):
@@ -269,6 +274,9 @@ class XsdNode:
     #: This supports dot notation to access related attributes.
     model_attribute: str | None
 
+    #: Whether the field is a lookup to a relation (using dot notation).
+    is_flattened: bool
+
     def __init__(
         self,
         name: str,
@@ -289,6 +297,10 @@ class XsdNode:
         if ":" in self.name:
             raise ValueError("Use 'prefix' argument for namespaces")
 
+        self.is_flattened = "." in self.model_attribute
+
+        # Avoid a property call in get_value(), which runs for every field of every row.
+        self._is_complex_type = type.is_complex_type
         self._attrgetter = operator.attrgetter(self.model_attribute)
         self._valuegetter = self._build_valuegetter(self.model_attribute, self.source)
 
@@ -337,11 +349,6 @@ class XsdNode:
         """Tell whether this node is backed by an PostgreSQL Array Field."""
         return ArrayField is not None and isinstance(self.source, ArrayField)
 
-    @cached_property
-    def is_flattened(self) -> bool:
-        """Whether the field is a lookup to a relation."""
-        return "." in self.model_attribute
-
     @cached_property
     def xml_name(self):
         """The XML element/attribute name."""
@@ -391,7 +398,7 @@ class XsdNode:
         # For foreign keys, it's not possible to use the model value,
         # as that would conflict with the field type in the XSD schema.
         try:
-            if self.type.is_complex_type:
+            if self._is_complex_type:
                 # This element has sub elements, which need the Django model instance.
                 # Avoid unwanted value_from_object(), instead return the model instance.
                 value = self._attrgetter(instance)
@@ -417,6 +424,23 @@ class XsdNode:
         """Internal cached field for to_python()"""
         return self.source.formfield()
 
+    @cached_property
+    def _allowed_lookups(self) -> set[str]:
+        """Internal cached set of lookups for validate_comparison()"""
+        # get_lookups() also returns transforms, which get_lookup() filters out.
+        allowed = {
+            name
+            for name, cls in self.source.get_lookups().items()
+            if issubclass(cls, Lookup)
+        }
+        if isinstance(self.source, RelatedField):
+            allowed &= {
+                name
+                for name, cls in self.source.target_field.get_lookups().items()
+                if issubclass(cls, Lookup)
+            }
+        return allowed
+
     def to_python(self, raw_value: str):
         """Convert a raw value to the Python data type for this element type."""
         try:
@@ -450,10 +474,7 @@ class XsdNode:
             # Check whether the Django model field supports the lookup
             # This prevents calling LIKE on a datetime or float field.
             # For foreign keys, this depends on the target field type.
-            if self.source.get_lookup(lookup) is None or (
-                isinstance(self.source, RelatedField)
-                and self.source.target_field.get_lookup(lookup) is None
-            ):
+            if lookup not in self._allowed_lookups:
                 raise OperationProcessingFailed(
                     "filter",
                     f"Operator '{tag}' is not supported for the '{self.name}' property.",
@@ -505,16 +526,16 @@ class XsdElement(XsdNode):
 
     @cached_property
     def as_xml(self):
-        attributes = [f'name="{self.name}" type="{self.type}"']
-        if self.min_occurs is not None:
-            attributes.append(f'minOccurs="{self.min_occurs}"')
-        if self.max_occurs is not None:
-            attributes.append(f'maxOccurs="{self.max_occurs}"')
-        if self.nillable:
-            str_bool = "true" if self.nillable else "false"
-            attributes.append(f'nillable="{str_bool}"')
-
-        return "<element {} />".format(" ".join(attributes))
+        """The XMLSchema definition of this element."""
+        min_occurs = self.min_occurs
+        max_occurs = self.max_occurs
+        min_occurs_attr = f' minOccurs="{min_occurs}"' if min_occurs is not None else ""
+        max_occurs_attr = f' maxOccurs="{max_occurs}"' if max_occurs is not None else ""
+        nillable_attr = ' nillable="true"' if self.nillable else ""
+        return (
+            f'<element name="{self.name}" type="{self.type}"'
+            f"{min_occurs_attr}{max_occurs_attr}{nillable_attr} />"
+        )
 
     def __str__(self):
         return self.as_xml
@@ -709,6 +730,35 @@ class XsdComplexType(XsdAnyType):
     #: The Django model class that this type was based on.
     source: type[models.Model] | None = None
 
+    #: Shortcut to get all geometry elements
+    geometry_elements: tuple[XsdElement, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    #: Shortcut to get all elements with a complex type
+    complex_elements: tuple[_XsdElement_WithComplexType, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    #: Shortcut to get all elements with a flattened model attribute
+    flattened_elements: tuple[XsdElement, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # As the elements don't change, the shortcuts are calculated once.
+        # This dataclass is frozen, hence the object.__setattr__() calls.
+        # Subclasses may still override these with a property or cached_property.
+        shortcuts = {
+            "geometry_elements": lambda e: e.is_geometry,
+            "complex_elements": lambda e: e.type.is_complex_type,
+            "flattened_elements": lambda e: e.is_flattened,
+        }
+        for name, condition in shortcuts.items():
+            if getattr(type(self), name, None) is None:
+                value = tuple(e for e in self.elements if condition(e))
+                object.__setattr__(self, name, value)
+
     def __str__(self):
         return self.xml_name
 
@@ -721,21 +771,6 @@ class XsdComplexType(XsdAnyType):
     def is_complex_type(self):
         return True  # a property to avoid being used as field.
 
-    @cached_property
-    def geometry_elements(self) -> list[XsdElement]:
-        """Shortcut to get all geometry elements"""
-        return [e for e in self.elements if e.is_geometry]
-
-    @cached_property
-    def complex_elements(self) -> list[_XsdElement_WithComplexType]:
-        """Shortcut to get all elements with a complex type"""
-        return [e for e in self.elements if e.type.is_complex_type]
-
-    @cached_property
-    def flattened_elements(self) -> list[XsdElement]:
-        """Shortcut to get all elements with a flattened model attribite"""
-        return [e for e in self.elements if e.is_flattened]
-
     def resolve_element_path(self, xpath: str) -> list[XsdNode] | None:
         """Resolve a xpath reference to the actual node.
         This returns the whole path, including in-between relations, if a match was found.
@@ -743,45 +778,62 @@ class XsdComplexType(XsdAnyType):
         This is used by :meth:`~gisserver.features.FeatureType.resolve_element`
         to convert a request XPath element into the ORM attributes for database queries.
         """
-        try:
-            pos = xpath.rindex("/")
-            node_name = xpath[:pos]
-        except ValueError:
-            node_name = xpath
-            pos = 0
+        xsd_type = self
+        nodes = []
+        parts = xpath.split("/")
+        last = len(parts) - 1
+        for i, node_name in enumerate(parts):
+            # Strip any [@attr=..] conditions.
+            # Most paths don't have these, so the regex can be skipped.
+            if "[" in node_name:
+                node_name = RE_XPATH_ATTR.sub("", node_name)
+
+            if node_name.startswith("@"):
+                # Resolve attributes (e.g. gml:id)
+                if i != last:
+                    return None  # invalid attribute
+
+                # Remove app: prefixes, or any alias of it (see explanation below)
+                attribute = xsd_type._find_attribute(xml_name=node_name[1:])
+                if attribute is None:
+                    return None
+                nodes.append(attribute)
+            else:
+                element = xsd_type._find_element(node_name)
+                if element is None:
+                    return None
+                nodes.append(element)
 
-        # Strip any [@attr=..] conditions
-        node_name = RE_XPATH_ATTR.sub("", node_name)
+                if i != last:
+                    if not element.type.is_complex_type:
+                        return None
 
-        if node_name.startswith("@"):
-            # Resolve attributes (e.g. gml:id)
-            if pos:
-                return None  # invalid attribute
+                    # Continue in the child node to find the next part
+                    xsd_type = element.type
 
-            # Remove app: prefixes, or any alias of it (see explanation below)
-            xml_name = node_name[1:]
-            attribute = self._find_attribute(xml_name=xml_name)
-            return [attribute] if attribute is not None else None
-        else:
-            element = self._find_element(node_name)
-            if element is None:
-                return None
+        return nodes
 
-            if pos:
-                if not element.type.is_complex_type:
-                    return None
-                else:
-                    # Recurse into the child node to find the next part
-                    child_path = element.type.resolve_element_path(xpath[pos + 1 :])
-                    return [element] + child_path if child_path is not None else None
-            else:
-                return [element]
+    @cached_property
+    def _elements_by_xml_name(self) -> dict[str, XsdElement]:
+        """Internal index for _find_element(), the first element wins on duplicates."""
+        index = {}
+        for element in self.elements:
+            index.setdefault(element.xml_name, element)
+        return index
+
+    @cached_property
+    def _elements_by_name(self) -> dict[str, XsdElement]:
+        """Internal index for _find_element() to resolve names with any prefix."""
+        index = {}
+        for element in self.elements:
+            index.setdefault(element.name, element)
+        return index
 
     def _find_element(self, xml_name) -> XsdElement | None:
         """Locate an element by name"""
-        for element in self.elements:
-            if element.xml_name == xml_name:
-                return element
+        element = self._elements_by_xml_name.get(xml_name)
+        if element is not None:
+            return element
 
         prefix, name = split_xml_name(xml_name)
         if prefix != "gml" and prefix != self.prefix:
@@ -790,9 +842,9 @@ class XsdComplexType(XsdAnyType):
             # doesn't provide access to 'xmlns' definitions on the element (or it's
             # parents), so a tag like this is essentially not parsable for us:
             # <ValueReference xmlns:tns="http://...">tns:fieldname</ValueReference>
-            for element in self.elements:
-                if element.name == name:
-                    return element
+            element = self._elements_by_name.get(name)
+            if element is not None:
+                return element
 
         # When there is a base class, resolve elements there too.
         if self.base.is_complex_type:
@@ -821,11 +873,8 @@ class XsdComplexType(XsdAnyType):
 
 def split_xml_name(xml_name: str) -> tuple[str | None, str]:
     """Remove the namespace prefix from an element."""
-    try:
-        prefix, name = xml_name.split(":", 1)
-        return prefix, name
-    except ValueError:
-        return None, xml_name
+    prefix, colon, name = xml_name.partition(":")
+    return (prefix, name) if colon else (None, xml_name)
 
 
 class ORMPath:
@@ -349,12 +349,59 @@ def test_fes20_c5_example5():
     assert query == CompiledQuery(
         typed_lookups={
             "BUILTUPA_1M": [Q(pk="4321")],
-            "INWATERA_1M": [Q(pk="3456") | Q(pk="7890")],
-            "TREESA_1M": [Q(pk="1234") | Q(pk="5678") | Q(pk="9012")],
+            "INWATERA_1M": [Q(pk__in=["3456", "7890"])],
+            "TREESA_1M": [Q(pk__in=["1234", "5678", "9012"])],
         }
     ), repr(query)
 
 
+def test_fes20_c5_example5_dotted_type_names():
+    """Prove that dotted type names don't split the identifiers of other types.
+    Sorting on rid would place "a.b.1" between "a.a" and "a.c",
+    which broke grouping the "a" identifiers together.
+    """
+    xml_text = """
+        <fes:Filter xmlns:fes="http://www.opengis.net/fes/2.0">
+            <fes:ResourceId rid="a.a"/>
+            <fes:ResourceId rid="a.b.1"/>
+            <fes:ResourceId rid="a.c"/>
+        </fes:Filter>
+    """.strip()
+    result = Filter.from_string(xml_text)
+    query = result.compile_query()
+    assert query == CompiledQuery(
+        typed_lookups={
+            "a": [Q(pk__in=["a", "c"])],
+            "a.b": [Q(pk="1")],
+        }
+    ), repr(query)
+
+
+@pytest.mark.parametrize(
+    "resource_ids",
+    [
+        '<fes:ResourceId rid="a.1" version="2"/>',
+        '<fes:ResourceId rid="a.1"/><fes:ResourceId rid="a.2" version="2"/>',
+    ],
+)
+def test_fes20_c5_example5_version_unsupported(resource_ids):
+    """Prove that versioned identifiers are rejected, also when mixed with plain ones."""
+    xml_text = f"""
+        <fes:Filter xmlns:fes="http://www.opengis.net/fes/2.0">{resource_ids}</fes:Filter>
+    """.strip()
+    result = Filter.from_string(xml_text)
+    with pytest.raises(NotImplementedError):
+        result.compile_query()
+
+
+def test_fes20_c5_example5_type_names_order():
+    """The type names follow the request order, not the alphabetical order.
+    This also defines the order of the typeNames in AdhocQuery.bind().
+    """
+    operator = IdOperator([ResourceId(rid="b.1"), ResourceId(rid="a.1")])
+    assert operator.type_names == ["b", "a"]
+
+
 def test_fes20_c5_example6():
     """The following filter includes the encoding of a function. This filter
     identifies all features where the sine() of the property named
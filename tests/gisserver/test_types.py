@@ -0,0 +1,92 @@
+import pytest
+
+from gisserver.exceptions import OperationProcessingFailed
+from gisserver.types import (
+    XPathMatch,
+    XsdAttribute,
+    XsdComplexType,
+    XsdElement,
+    XsdTypes,
+)
+from tests.test_gisserver.models import Restaurant
+
+
+class TestXsdComplexType:
+    def setup_method(self):
+        self.street = XsdElement("street", type=XsdTypes.string)
+        self.city = XsdElement("city", type=XsdTypes.string)
+        self.address_type = XsdComplexType(
+            name="AddressType",
+            elements=[self.street, self.city],
+            attributes=[XsdAttribute("code")],
+        )
+        self.address = XsdElement("address", type=self.address_type)
+        self.owner_type = XsdComplexType(name="OwnerType", elements=[self.address])
+        self.owner = XsdElement("owner", type=self.owner_type)
+        self.name = XsdElement("name", type=XsdTypes.string)
+        self.xsd_type = XsdComplexType(
+            name="RestaurantType", elements=[self.name, self.owner]
+        )
+
+    def test_resolve_element_path(self):
+        assert self.xsd_type.resolve_element_path("name") == [self.name]
+        assert self.xsd_type.resolve_element_path("app:name") == [self.name]
+        assert self.xsd_type.resolve_element_path("owner/address/city") == [
+            self.owner,
+            self.address,
+            self.city,
+        ]
+
+    def test_resolve_element_path_attribute(self):
+        nodes = self.xsd_type.resolve_element_path("owner/address/@code")
+        assert nodes[:2] == [self.owner, self.address]
+        assert nodes[2].name == "code"
+
+    def test_resolve_element_path_invalid(self):
+        assert self.xsd_type.resolve_element_path("unknown") is None
+        assert self.xsd_type.resolve_element_path("name/street") is None
+        assert self.xsd_type.resolve_element_path("owner/unknown") is None
+        assert self.xsd_type.resolve_element_path("@code/street") is None
+
+
+class TestXsdElement:
+    def test_as_xml(self):
+        xsd_element = XsdElement("name", type=XsdTypes.string, min_occurs=0)
+        xsd_element.nillable = True  # subclasses may still change this after init.
+        assert str(xsd_element) == (
+            '<element name="name" type="string" minOccurs="0" nillable="true" />'
+        )
+
+    def test_validate_comparison(self):
+        created = XsdElement(
+            "created",
+            type=XsdTypes.dateTime,
+            source=Restaurant._meta.get_field("created"),
+        )
+        assert created.validate_comparison("2020-04-05T12:11:10+00:00", lookup="gte")
+
+    @pytest.mark.parametrize(
+        ["name", "type", "lookup"],
+        [
+            ("created", XsdTypes.dateTime, "fes_like"),
+            ("created", XsdTypes.dateTime, "year"),  # transform, not a lookup
+            ("tags", XsdTypes.string, "len"),  # transform, not a lookup
+        ],
+    )
+    def test_validate_comparison_unsupported(self, name, type, lookup):
+        """Prove that unsupported lookups and transforms are rejected."""
+        xsd_element = XsdElement(
+            name, type=type, source=Restaurant._meta.get_field(name)
+        )
+        with pytest.raises(OperationProcessingFailed):
+            xsd_element.validate_comparison("2020-04-05T12:11:10+00:00", lookup=lookup)
+
+
+class TestXPathMatch:
+    @pytest.mark.parametrize(
+        "query", ["owner[@gml:id='1']/name", "owner/name[@lang='nl']"]
+    )
+    def test_predicates_unsupported(self, query):
+        """Prove that predicates are rejected at every position of the path."""
+        with pytest.raises(NotImplementedError):
+            XPathMatch(None, nodes=[], query=query)